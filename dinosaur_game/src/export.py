@@ -0,0 +1,245 @@
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+
+# Run pygame without a window - the export never shows anything on screen
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# Leave SIGTERM alone so the pool can stop workers when rendering fails
+os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+# Keep stdout clean for raw frame streams
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+from game import DinosaurGame
+from obstacles import Cactus
+from powerups import Star
+
+FPS = 60
+
+# Input script key names
+SCRIPT_KEYS = {
+    'space': pygame.K_SPACE,
+    'shift': pygame.K_LSHIFT
+}
+
+
+def load_script(path):
+    # Each line is "<tick> <space|shift> <down|up>", '#' starts a comment
+    events = {}
+    with open(path) as script:
+        for line_number, line in enumerate(script, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            if (len(parts) != 3 or not parts[0].isdigit()
+                    or parts[1] not in SCRIPT_KEYS or parts[2] not in ('down', 'up')):
+                raise ValueError(f"{path}:{line_number}: expected '<tick> <space|shift> <down|up>'")
+            events.setdefault(int(parts[0]), []).append((SCRIPT_KEYS[parts[1]], parts[2] == 'down'))
+    return events
+
+
+def take_snapshot(game, tick):
+    player = game.player
+    return {
+        'tick': tick,
+        'ticks_ms': game.fixed_ticks,
+        'score': game.score,
+        'high_score': game.high_score,
+        'game_active': game.game_active,
+        'is_powered_up': game.is_powered_up,
+        'powerup_timer': game.powerup_timer,
+        'player': (player.rect.x, player.rect.y, player.is_charging, player.jump_charge,
+                   player.is_gliding, player.fart_timer, player.poop_count),
+        'active_poops': [(poop['x'], poop['y']) for poop in player.active_poops],
+        'ground_poops': [(poop['x'], poop['y']) for poop in player.ground_poops],
+        'obstacles': [(obstacle.rect.x, obstacle.rect.y, obstacle.width, obstacle.height,
+                       obstacle.alpha, obstacle.fading) for obstacle in game.obstacles],
+        'powerups': [(powerup.rect.x, powerup.rect.y) for powerup in game.powerups]
+    }
+
+
+def simulate(seed, script_events, max_ticks, tail):
+    # Run the game logic headless and record a snapshot for every tick
+    game = DinosaurGame(seed)
+    game.game_active = True
+    game.in_menu = False
+    game.reset_game()
+
+    snapshots = []
+    space_held = False
+    tick = 0
+    game_over_tick = None
+    while tick < max_ticks:
+        game.fixed_ticks = tick * 1000 // FPS
+
+        for key, is_down in script_events.get(tick, []):
+            if is_down:
+                game.handle_key_down(key)
+            else:
+                game.handle_key_up(key)
+            if key == pygame.K_SPACE:
+                space_held = is_down
+        game.handle_glide(space_held)
+        game.update()
+        snapshots.append(take_snapshot(game, tick))
+
+        # Keep the game over screen up for a short tail, then stop
+        if not game.game_active:
+            if game_over_tick is None:
+                game_over_tick = tick
+            elif tick - game_over_tick >= tail:
+                break
+        tick += 1
+
+    pygame.quit()
+    return snapshots
+
+
+# Per-worker state, set up once by init_worker
+worker_game = None
+worker_images = {}
+
+
+def init_worker():
+    global worker_game
+    worker_game = DinosaurGame()
+    worker_game.in_menu = False
+    worker_images['cactus'] = pygame.image.load('../../dinosaur_game/assets/cactus.png').convert_alpha()
+    worker_images['star'] = Star(0, 0).image
+
+
+def cactus_image(width, height):
+    key = ('cactus', width, height)
+    if key not in worker_images:
+        worker_images[key] = pygame.transform.scale(worker_images['cactus'], (width, height))
+    return worker_images[key]
+
+
+def restore_snapshot(game, snapshot):
+    game.fixed_ticks = snapshot['ticks_ms']
+    game.score = snapshot['score']
+    game.high_score = snapshot['high_score']
+    game.game_active = snapshot['game_active']
+    game.is_powered_up = snapshot['is_powered_up']
+    game.powerup_timer = snapshot['powerup_timer']
+
+    player = game.player
+    (player.rect.x, player.rect.y, player.is_charging, player.jump_charge,
+     player.is_gliding, player.fart_timer, player.poop_count) = snapshot['player']
+    player.active_poops = [{'x': x, 'y': y} for x, y in snapshot['active_poops']]
+    player.ground_poops = [{'x': x, 'y': y} for x, y in snapshot['ground_poops']]
+
+    # Rebuild drawable objects without rerunning their random setup
+    game.obstacles = []
+    for x, y, width, height, alpha, fading in snapshot['obstacles']:
+        cactus = Cactus.__new__(Cactus)
+        cactus.image = cactus_image(width, height)
+        cactus.rect = cactus.image.get_rect(topleft=(x, y))
+        cactus.alpha = alpha
+        cactus.fading = fading
+        game.obstacles.append(cactus)
+
+    game.powerups = []
+    for x, y in snapshot['powerups']:
+        star = Star.__new__(Star)
+        star.image = worker_images['star']
+        star.rect = star.image.get_rect(topleft=(x, y))
+        game.powerups.append(star)
+
+
+def render_chunk(job):
+    snapshots, out_format, out_dir = job
+    frames = []
+    for snapshot in snapshots:
+        restore_snapshot(worker_game, snapshot)
+        worker_game.draw()
+        if out_format == 'png':
+            path = os.path.join(out_dir, f"frame_{snapshot['tick']:06d}.png")
+            pygame.image.save(worker_game.screen, path)
+        else:
+            frames.append(pygame.image.tostring(worker_game.screen, 'RGB'))
+    return b''.join(frames)
+
+
+def write_chunk(stream, data):
+    if stream:
+        stream.write(data)
+
+
+def export(seed, script_path, out, out_format='png', workers=None, max_ticks=FPS * 60 * 5,
+           tail=FPS * 2, chunk_size=FPS):
+    script_events = load_script(script_path) if script_path else {}
+
+    # Stale frames from a longer earlier run would end up on the end of the clip
+    if out_format == 'png' and glob.glob(os.path.join(out, 'frame_*.png')):
+        raise FileExistsError(f"{out} already has frame_*.png files, use an empty directory")
+
+    start = time.perf_counter()
+    snapshots = simulate(seed, script_events, max_ticks, tail)
+    sim_time = time.perf_counter() - start
+
+    if out_format == 'png':
+        os.makedirs(out, exist_ok=True)
+        stream = None
+    elif out == '-':
+        stream = sys.stdout.buffer
+    else:
+        stream = open(out, 'wb')
+
+    jobs = [(snapshots[i:i + chunk_size], out_format, out)
+            for i in range(0, len(snapshots), chunk_size)]
+
+    # Only keep a few chunks in flight so rendering waits for a slow writer
+    # instead of piling finished frames up in memory
+    max_in_flight = 2 * (workers or os.cpu_count() or 1)
+    try:
+        with multiprocessing.Pool(workers, initializer=init_worker) as pool:
+            in_flight = deque()
+            for job in jobs:
+                in_flight.append(pool.apply_async(render_chunk, (job,)))
+                if len(in_flight) >= max_in_flight:
+                    write_chunk(stream, in_flight.popleft().get())
+            while in_flight:
+                write_chunk(stream, in_flight.popleft().get())
+            pool.close()
+            pool.join()
+    finally:
+        if stream and stream is not sys.stdout.buffer:
+            stream.close()
+
+    total_time = time.perf_counter() - start
+    playtime = len(snapshots) / FPS
+    print(f"Exported {len(snapshots)} frames ({playtime:.1f}s of play) in {total_time:.1f}s "
+          f"(simulation {sim_time:.1f}s)", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a scripted run to video frames")
+    parser.add_argument('--seed', type=int, required=True, help="random seed for the run")
+    parser.add_argument('--script', help="input script file (omit for no input)")
+    parser.add_argument('--out', required=True,
+                        help="output directory for png, or file for raw ('-' for stdout)")
+    parser.add_argument('--format', choices=['png', 'raw'], default='png',
+                        help="numbered PNG sequence or raw RGB24 stream")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="render processes (default: one per core)")
+    parser.add_argument('--max-ticks', type=int, default=FPS * 60 * 5,
+                        help="stop after this many ticks (default: 5 minutes)")
+    parser.add_argument('--tail', type=int, default=FPS * 2,
+                        help="ticks of game over screen to keep after a crash")
+    args = parser.parse_args()
+
+    try:
+        export(args.seed, args.script, args.out, args.format, args.workers, args.max_ticks, args.tail)
+    except (FileExistsError, ValueError) as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
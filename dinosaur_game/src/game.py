@@ -5,9 +5,11 @@ from obstacles import Cactus
 import random
 import math
 from powerups import Star
+from quality import QualityGovernor, QUALITY_HIGH, QUALITY_MEDIUM, QUALITY_LOW
+from tuning import load_tables, TuningWatcher
 
 class DinosaurGame:
-    def __init__(self):
+    def __init__(self, seed=None):
         pygame.init()
         self.screen_width = 800
         self.screen_height = 400
@@ -23,30 +25,58 @@ class DinosaurGame:
         # Font setup
         self.font = pygame.font.Font(None, 36)
         self.title_font = pygame.font.Font(None, 74)
+        self.small_font = pygame.font.Font(None, 24)
+        
+        # Cache rendered text so unchanged strings aren't re-rendered every frame
+        self.text_cache = {}
+        
+        # Semi-transparent game over overlay, built once
+        self.game_over_overlay = pygame.Surface((self.screen_width, self.screen_height))
+        self.game_over_overlay.fill((255, 255, 255))
+        self.game_over_overlay.set_alpha(128)
+        
+        # Adaptive quality - sheds visual effects when frames run over budget
+        self.quality = QualityGovernor()
         
         # High score tracking
         self.high_score = 0
         
+        # Difficulty and physics, compiled from tuning.json into lookup tables
+        self.tuning = load_tables()
+        self.tuning_watcher = None
+        
         # Power-up properties
         self.powerups = []
         self.powerup_timer = 0
-        self.powerup_duration = 300
+        self.powerup_duration = self.tuning.powerup_duration
         self.is_powered_up = False
-        self.powerup_spawn_chance = 0.08  # Initial spawn chance
+        
+        # Animation clock override (milliseconds), used by headless tools
+        self.fixed_ticks = None
+        
+        # Obstacles and stars each draw from their own generator, so a seeded
+        # course doesn't depend on anything else that uses random
+        self.seed = seed
+        self.obstacle_random = random.Random()
+        self.powerup_random = random.Random()
 
         self.reset_game()
 
     def reset_game(self):
+        # Every restart of a seeded game replays the same course
+        if self.seed is not None:
+            self.obstacle_random.seed(self.seed)
+            self.powerup_random.seed(self.seed + 1)
+        
         # Game objects
-        self.player = Dinosaur(50, 300)
+        self.player = Dinosaur(50, 300, self.tuning)
         self.player.poop_count = 3  # Start with 3 poops
         self.obstacles = []
         
         # Game state
         self.score = 0
-        self.game_speed = 5
+        self.game_speed = self.tuning.game_speeds[0]
         self.spawn_timer = 0
-        self.min_spawn_time = 60
         self.powerups = []
         self.powerup_timer = 0
         self.is_powered_up = False
@@ -60,81 +90,105 @@ class DinosaurGame:
                 self.running = False
             
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.game_active:
-                        self.game_active = False
-                        self.in_menu = True
-                    else:
-                        self.running = False
-                
-                elif event.key == pygame.K_SPACE:
-                    if self.game_active:
-                        if not self.player.is_jumping:
-                            self.player.start_charge()
-                    elif self.in_menu:
-                        self.game_active = True
-                        self.in_menu = False
-                        self.reset_game()
-                
-                elif event.key == pygame.K_LSHIFT and self.game_active:
-                    self.player.apply_boost()
-                
-                elif event.key == pygame.K_r and not self.game_active and not self.in_menu:
-                    self.game_active = True
-                    self.reset_game()
+                self.handle_key_down(event.key)
             
             elif event.type == pygame.KEYUP:
-                if event.key == pygame.K_SPACE and self.game_active:
-                    if self.player.is_charging:
-                        self.player.release_jump()
+                self.handle_key_up(event.key)
+        
+        self.handle_glide(keys[pygame.K_SPACE])
+
+    def handle_key_down(self, key):
+        if key == pygame.K_ESCAPE:
+            if self.game_active:
+                self.game_active = False
+                self.in_menu = True
+            else:
+                self.running = False
         
+        elif key == pygame.K_SPACE:
+            if self.game_active:
+                if not self.player.is_jumping:
+                    self.player.start_charge()
+            elif self.in_menu:
+                self.game_active = True
+                self.in_menu = False
+                self.reset_game()
+        
+        elif key == pygame.K_LSHIFT and self.game_active:
+            self.player.apply_boost()
+        
+        elif key == pygame.K_r and not self.game_active and not self.in_menu:
+            self.game_active = True
+            self.reset_game()
+
+    def handle_key_up(self, key):
+        if key == pygame.K_SPACE and self.game_active:
+            if self.player.is_charging:
+                self.player.release_jump()
+
+    def handle_glide(self, space_held):
         # Check for gliding - only glide while SPACE is held
         if self.game_active:
-            if keys[pygame.K_SPACE]:
+            if space_held:
                 self.player.start_glide()
             else:
                 self.player.stop_glide()
 
+    def watch_tuning(self):
+        # Hot reload tuning.json while the game is running
+        if self.tuning_watcher is None:
+            self.tuning_watcher = TuningWatcher()
+            self.tuning_watcher.start()
+
+    def apply_tuning(self, tuning):
+        self.tuning = tuning
+        self.powerup_duration = tuning.powerup_duration
+        self.player.apply_tuning(tuning)
+
+    def get_ticks(self):
+        # Offline tools pin the animation clock to the tick count so runs replay exactly
+        if self.fixed_ticks is not None:
+            return self.fixed_ticks
+        return pygame.time.get_ticks()
+
     def spawn_obstacle(self):
         if self.spawn_timer <= 0:
-            # Adjust spawn chance based on score - decrease at higher scores
-            base_spawn_chance = 0.3
-            score_factor = self.score / 2000  # Reduced from 1000 to make it scale slower
-            spawn_chance = base_spawn_chance + (0.2 - score_factor)  # Decreases as score increases
-            spawn_chance = max(0.15, min(0.5, spawn_chance))  # Cap between 15% and 50%
+            tuning = self.tuning
+            score_index = tuning.index(self.score)
             
-            if random.random() < spawn_chance:
-                # Reduce group spawn chance at higher scores
-                group_spawn_chance = 0.2 - (self.score / 5000)  # Reduces group spawns later
-                group_spawn_chance = max(0.05, group_spawn_chance)  # Minimum 5% chance
-                
-                if random.random() < group_spawn_chance:
-                    num_cacti = random.randint(2, 3)
-                    spacing = random.randint(60, 100)
+            # Spawn chance decreases as score increases (see tuning.json)
+            rng = self.obstacle_random
+            if rng.random() < tuning.spawn_chances[score_index]:
+                # Group spawns also get rarer at higher scores
+                if rng.random() < tuning.group_chances[score_index]:
+                    num_cacti = rng.randint(*tuning.group_size)
+                    spacing = rng.randint(*tuning.group_spacing)
                     
                     for i in range(num_cacti):
-                        cactus = Cactus(self.screen_width + (i * spacing))
+                        cactus = Cactus(self.screen_width + (i * spacing), tuning, rng)
                         self.obstacles.append(cactus)
                 else:
-                    self.obstacles.append(Cactus(self.screen_width))
+                    self.obstacles.append(Cactus(self.screen_width, tuning, rng))
                 
-                # Increase minimum spawn time at higher scores
-                base_spawn_time = self.min_spawn_time - (self.score // 100)
-                self.spawn_timer = min(80, max(30, base_spawn_time))  # Keep between 30 and 80
+                # Time until the next spawn shrinks at higher scores
+                self.spawn_timer = tuning.spawn_times[score_index]
         else:
             self.spawn_timer -= 1
 
     def spawn_powerup(self):
         if not self.powerups and not self.is_powered_up:
-            # Reduce star spawn chance as score increases
-            adjusted_spawn_chance = self.powerup_spawn_chance * (1 - (self.score / 10000))
-            adjusted_spawn_chance = max(0.01, adjusted_spawn_chance)  # Minimum 1% chance
-            
-            if random.random() < adjusted_spawn_chance:
-                y_pos = random.randint(100, 250)
+            # Star spawn chance decreases as score increases
+            if self.powerup_random.random() < self.tuning.powerup_chances[self.tuning.index(self.score)]:
+                y_pos = self.powerup_random.randint(*self.tuning.powerup_y_range)
                 self.powerups.append(Star(self.screen_width, y_pos))
 
     def update(self):
+        # Swap in reloaded tuning between ticks, never mid-update
+        if self.tuning_watcher:
+            tuning = self.tuning_watcher.poll()
+            if tuning:
+                self.apply_tuning(tuning)
+        
         if not self.game_active:
             return
             
@@ -148,7 +202,7 @@ class DinosaurGame:
         
         # Update and check powerup collisions
         for powerup in self.powerups[:]:
-            powerup.update()
+            powerup.update(self.get_ticks())
             if self.player.rect.colliderect(powerup.rect):
                 self.is_powered_up = True
                 self.powerup_timer = self.powerup_duration
@@ -180,12 +234,22 @@ class DinosaurGame:
         self.spawn_obstacle()
         self.spawn_powerup()
         
-        self.game_speed = 5 + (self.score // 100)
-        self.min_spawn_time = max(30, 60 - (self.score // 100))
+        score_index = self.tuning.index(self.score)
+        self.game_speed = self.tuning.game_speeds[score_index]
         
         for obstacle in self.obstacles:
             obstacle.speed = self.game_speed
 
+    def render_text(self, font, text, color):
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) > 64:  # Keep the cache small
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+
     def draw_menu(self):
         self.screen.fill((255, 255, 255))
         
@@ -275,12 +339,16 @@ class DinosaurGame:
         
         # Draw player with power-up effect
         if self.is_powered_up:
-            # Create pulsing glow effect
-            glow_size = math.sin(pygame.time.get_ticks() * 0.01) * 5 + 5
-            glow_surf = pygame.Surface((self.player.rect.width + glow_size * 2, 
-                                      self.player.rect.height + glow_size * 2), pygame.SRCALPHA)
-            pygame.draw.ellipse(glow_surf, (255, 255, 0, 100), glow_surf.get_rect())
-            self.screen.blit(glow_surf, (self.player.rect.x - glow_size, self.player.rect.y - glow_size))
+            if self.quality.level == QUALITY_HIGH:
+                # Create pulsing glow effect
+                glow_size = math.sin(self.get_ticks() * 0.01) * 5 + 5
+                glow_surf = pygame.Surface((self.player.rect.width + glow_size * 2, 
+                                          self.player.rect.height + glow_size * 2), pygame.SRCALPHA)
+                pygame.draw.ellipse(glow_surf, (255, 255, 0, 100), glow_surf.get_rect())
+                self.screen.blit(glow_surf, (self.player.rect.x - glow_size, self.player.rect.y - glow_size))
+            elif self.quality.level == QUALITY_MEDIUM:
+                # Simple glow outline drawn straight to the screen
+                pygame.draw.ellipse(self.screen, (255, 215, 0), self.player.rect.inflate(10, 10), 2)
             
             # Draw power-up timer in center
             timer_width = 100
@@ -303,18 +371,18 @@ class DinosaurGame:
                            (timer_x, timer_y, timer_width, timer_height), 1)
             
             # Draw "STAR POWER!" text under timer
-            power_text = self.font.render("STAR POWER!", True, (255, 215, 0))  # Gold color
+            power_text = self.render_text(self.font, "STAR POWER!", (255, 215, 0))  # Gold color
             text_rect = power_text.get_rect(midtop=(self.screen_width//2, timer_y + timer_height + 5))
             self.screen.blit(power_text, text_rect)
         
-        self.player.draw(self.screen)
+        self.player.draw(self.screen, self.quality.level)
         
         # Draw obstacles
         for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
+            obstacle.draw(self.screen, self.quality.level)
         
         # Draw current score
-        score_text = self.font.render(f'Score: {self.score}', True, (0, 0, 0))
+        score_text = self.render_text(self.font, f'Score: {self.score}', (0, 0, 0))
         self.screen.blit(score_text, (20, 20))
         
         # Draw poop counter in left column
@@ -323,12 +391,12 @@ class DinosaurGame:
             poop_rect = self.player.poop_image.get_rect(midtop=(20 + self.player.poop_image.get_width()//2, 60))
             
             # Draw counter text
-            counter_text = self.font.render(f'x {self.player.poop_count}', True, (139, 69, 19))  # Brown color
+            counter_text = self.render_text(self.font, f'x {self.player.poop_count}', (139, 69, 19))  # Brown color
             counter_rect = counter_text.get_rect(midleft=(poop_rect.right + 10, poop_rect.centery))
             
             # Draw "Press SHIFT to use!" text if this is the first poop
-            if self.player.poop_count == 1:
-                hint_text = pygame.font.Font(None, 24).render("Press SHIFT to use!", True, (139, 69, 19))
+            if self.player.poop_count == 1 and self.quality.level < QUALITY_LOW:
+                hint_text = self.render_text(self.small_font, "Press SHIFT to use!", (139, 69, 19))
                 hint_rect = hint_text.get_rect(topleft=(poop_rect.left, poop_rect.bottom + 5))
                 self.screen.blit(hint_text, hint_rect)
             
@@ -337,28 +405,25 @@ class DinosaurGame:
 
     def draw_game_over(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((255, 255, 255))
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.game_over_overlay, (0, 0))
         
         # Game Over text
-        game_over_text = self.title_font.render("Game Over!", True, (0, 0, 0))
+        game_over_text = self.render_text(self.title_font, "Game Over!", (0, 0, 0))
         game_over_rect = game_over_text.get_rect(center=(self.screen_width//2, self.screen_height//3))
         
         # Score text
-        score_text = self.font.render(f'Final Score: {self.score}', True, (0, 0, 0))
+        score_text = self.render_text(self.font, f'Final Score: {self.score}', (0, 0, 0))
         score_rect = score_text.get_rect(center=(self.screen_width//2, self.screen_height//2))
         
         # High Score text
         if self.score >= self.high_score:
-            high_score_text = self.font.render("New High Score!", True, (255, 0, 0))  # Red color for new high score
+            high_score_text = self.render_text(self.font, "New High Score!", (255, 0, 0))  # Red color for new high score
         else:
-            high_score_text = self.font.render(f'High Score: {self.high_score}', True, (0, 0, 0))
+            high_score_text = self.render_text(self.font, f'High Score: {self.high_score}', (0, 0, 0))
         high_score_rect = high_score_text.get_rect(center=(self.screen_width//2, self.screen_height//2 + 40))
         
         # Restart instructions
-        restart_text = self.font.render("Press R to Restart", True, (0, 0, 0))
+        restart_text = self.render_text(self.font, "Press R to Restart", (0, 0, 0))
         restart_rect = restart_text.get_rect(center=(self.screen_width//2, self.screen_height*2//3))
         
         self.screen.blit(game_over_text, game_over_rect)
@@ -376,11 +441,16 @@ class DinosaurGame:
             self.draw_game_over()
 
     def run(self):
+        self.watch_tuning()
+        
         while self.running:
+            # Time the frame's work (not the tick wait) for the quality governor
+            self.quality.start_frame()
             self.handle_events()
             self.update()
             self.draw()
             pygame.display.flip()
+            self.quality.end_frame()
             self.clock.tick(60)
 
         pygame.quit()
@@ -1,40 +1,21 @@
 import pygame
-import random
+from quality import QUALITY_HIGH, QUALITY_MEDIUM
 
 class Cactus:
-    def __init__(self, screen_width):
-        # Create more extreme size variations
-        self.type = random.choice(['small', 'medium', 'large', 'extra_large'])
-        
-        # Size configurations based on type
-        self.size_configs = {
-            'small': {
-                'width_range': (20, 30),
-                'height_range': (40, 60)
-            },
-            'medium': {
-                'width_range': (30, 45),
-                'height_range': (60, 80)
-            },
-            'large': {
-                'width_range': (40, 55),
-                'height_range': (70, 90)
-            },
-            'extra_large': {
-                'width_range': (50, 65),
-                'height_range': (85, 110)
-            }
-        }
+    def __init__(self, screen_width, tuning, rng):
+        # Create more extreme size variations (size types come from tuning.json)
+        self.type = rng.choice(tuning.cactus_types)
         
         # Set random dimensions based on type
-        config = self.size_configs[self.type]
-        self.width = random.randint(*config['width_range'])
-        self.height = random.randint(*config['height_range'])
+        width_range, height_range = tuning.cactus_sizes[self.type]
+        self.width = rng.randint(*width_range)
+        self.height = rng.randint(*height_range)
         
         # Sometimes create wider but shorter cacti for variety
-        if random.random() < 0.3:
-            self.width = int(self.width * 1.5)
-            self.height = int(self.height * 0.8)
+        if rng.random() < tuning.cactus_wide_chance:
+            width_scale, height_scale = tuning.cactus_wide_scale
+            self.width = int(self.width * width_scale)
+            self.height = int(self.height * height_scale)
         
         self.x = screen_width
         self.y = 360 - self.height  # Ground level - height
@@ -62,12 +43,17 @@ class Cactus:
     def is_off_screen(self):
         return self.x < -self.width 
 
-    def draw(self, screen):
-        if self.fading:
+    def draw(self, screen, quality=QUALITY_HIGH):
+        if self.fading and quality == QUALITY_HIGH:
             # Create a copy of the image with new alpha
             fade_image = self.image.copy()
             fade_image.fill((255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT)
             screen.blit(fade_image, self.rect)
+        elif self.fading and quality == QUALITY_MEDIUM:
+            # Cheaper fade - blend with surface alpha instead of copying
+            self.image.set_alpha(self.alpha)
+            screen.blit(self.image, self.rect)
+            self.image.set_alpha(None)
         else:
             screen.blit(self.image, self.rect)
         
@@ -1,16 +1,13 @@
 import pygame
+from quality import QUALITY_HIGH, QUALITY_LOW
 
 class Dinosaur:
-    def __init__(self, x, y):
+    def __init__(self, x, y, tuning):
         self.ground_level = 360  # Ground level
         
         self.x = x
         self.y = self.ground_level - 60 - 35  # Adjusted: ground level - dino height - offset
         self.velocity = 0
-        self.gravity = 0.8
-        self.min_jump_power = -12
-        self.max_jump_power = -20
-        self.charge_rate = 0.8
         self.jump_charge = 0
         self.is_jumping = False
         self.is_charging = False
@@ -27,20 +24,13 @@ class Dinosaur:
             'high': (255, 0, 0)       # Red
         }
         
-        # Adjust gliding properties for better feel
         self.is_gliding = False
-        self.glide_gravity = 0.05  # Reduced from 0.1 to 0.05 for much slower falling
-        self.normal_gravity = 0.8  # Store normal gravity value
-        self.min_glide_speed = 1   # Reduced minimum falling speed while gliding
         
         # Load glider image
         glider_image = pygame.image.load('../../dinosaur_game/assets/glider.png').convert_alpha()
         self.glider_image = pygame.transform.scale(glider_image, (60, 40))  # Adjust size as needed
         
         # Fart boost properties
-        self.fart_boost_power = -8  # Weaker than poop boost
-        self.fart_forward = 50  # Less forward momentum than poop
-        self.fart_duration = 10
         self.fart_timer = 0
         self.can_fart = True  # Track if we can fart in this jump
         
@@ -50,11 +40,13 @@ class Dinosaur:
         
         # Poop properties
         self.poop_count = 0
-        self.poop_boost_power = -12
-        self.poop_forward = 80
-        self.poop_duration = 15
         self.poop_timer = 0
         
+        # Font for the boost counter, created once instead of every frame
+        self.boost_font = pygame.font.Font(None, 24)
+        self.boost_text = None
+        self.boost_text_count = None  # Count the cached text was rendered for
+        
         # Load poop image
         poop_image = pygame.image.load('../../dinosaur_game/assets/poop.png').convert_alpha()
         self.poop_image = pygame.transform.scale(poop_image, (35, 35))
@@ -62,6 +54,28 @@ class Dinosaur:
         # Add poop animation properties
         self.active_poops = []  # List to track falling poops
         self.ground_poops = []  # List to track poops that have landed
+        
+        # Jump, glide and boost physics come from tuning.json
+        self.apply_tuning(tuning)
+
+    def apply_tuning(self, tuning):
+        self.gravity = tuning.gravity
+        self.normal_gravity = tuning.gravity
+        self.min_jump_power = tuning.min_jump_power
+        self.max_jump_power = tuning.max_jump_power
+        self.charge_rate = tuning.charge_rate
+        
+        # Gliding - much lighter gravity with a minimum falling speed
+        self.glide_gravity = tuning.glide_gravity
+        self.min_glide_speed = tuning.min_glide_speed
+        
+        # Fart boost is weaker than poop boost
+        self.fart_boost_power = tuning.fart_boost_power
+        self.fart_forward = tuning.fart_forward
+        self.fart_duration = tuning.fart_duration
+        self.poop_boost_power = tuning.poop_boost_power
+        self.poop_forward = tuning.poop_forward
+        self.poop_duration = tuning.poop_duration
 
     def start_charge(self):
         if not self.is_jumping:
@@ -179,7 +193,7 @@ class Dinosaur:
             self.poop_count -= 1
             self.poop_timer = self.poop_duration
 
-    def draw(self, screen):
+    def draw(self, screen, quality=QUALITY_HIGH):
         # Draw the dinosaur
         screen.blit(self.image, self.rect)
         
@@ -212,7 +226,7 @@ class Dinosaur:
             screen.blit(self.poop_image, poop_rect)
         
         # Draw jump charge meter and visual feedback
-        if self.is_charging:
+        if self.is_charging and quality < QUALITY_LOW:
             charge_percent = (self.min_jump_power - self.jump_charge) / (self.min_jump_power - self.max_jump_power)
             
             # Draw charge meter background
@@ -231,19 +245,23 @@ class Dinosaur:
                             40, 10), 1)
             
             # Draw arrow indicating jump height
-            arrow_height = 50 * charge_percent
-            pygame.draw.line(screen, self.get_charge_color(),
-                           (self.rect.right + 5, self.rect.y),
-                           (self.rect.right + 5, self.rect.y - arrow_height),
-                           2)
-            # Draw arrow head
-            pygame.draw.polygon(screen, self.get_charge_color(), [
-                (self.rect.right + 5, self.rect.y - arrow_height),
-                (self.rect.right, self.rect.y - arrow_height + 5),
-                (self.rect.right + 10, self.rect.y - arrow_height + 5)
-            ])
-        
-        # Draw poop boost counter if any are available
-        if self.poop_count > 0:
-            boost_text = pygame.font.Font(None, 24).render(f'Boosts: {self.poop_count}', True, (255, 140, 0))
-            screen.blit(boost_text, (self.rect.right + 10, self.rect.top))
\ No newline at end of file
+            if quality == QUALITY_HIGH:
+                arrow_height = 50 * charge_percent
+                pygame.draw.line(screen, self.get_charge_color(),
+                               (self.rect.right + 5, self.rect.y),
+                               (self.rect.right + 5, self.rect.y - arrow_height),
+                               2)
+                # Draw arrow head
+                pygame.draw.polygon(screen, self.get_charge_color(), [
+                    (self.rect.right + 5, self.rect.y - arrow_height),
+                    (self.rect.right, self.rect.y - arrow_height + 5),
+                    (self.rect.right + 10, self.rect.y - arrow_height + 5)
+                ])
+        
+        # Draw poop boost counter if any are available (decorative, dropped at low quality)
+        if self.poop_count > 0 and quality < QUALITY_LOW:
+            # Only re-render the text when the count changes
+            if self.boost_text_count != self.poop_count:
+                self.boost_text = self.boost_font.render(f'Boosts: {self.poop_count}', True, (255, 140, 0))
+                self.boost_text_count = self.poop_count
+            screen.blit(self.boost_text, (self.rect.right + 10, self.rect.top))
\ No newline at end of file
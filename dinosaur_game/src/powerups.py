@@ -17,10 +17,12 @@ class Star:
         self.float_speed = 0.1
         self.float_range = 20
 
-    def update(self):
+    def update(self, ticks=None):
         self.x -= self.speed
+        if ticks is None:
+            ticks = pygame.time.get_ticks()
         # Add floating motion
-        self.float_offset = math.sin(pygame.time.get_ticks() * self.float_speed) * self.float_range
+        self.float_offset = math.sin(ticks * self.float_speed) * self.float_range
         self.rect.x = self.x
         self.rect.y = self.y + self.float_offset
 
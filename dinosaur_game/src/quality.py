@@ -0,0 +1,79 @@
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Quality levels - higher number means fewer visual effects
+QUALITY_HIGH = 0    # Everything on
+QUALITY_MEDIUM = 1  # Simplified glow and fades, no charge arrow
+QUALITY_LOW = 2     # No glow, fades, charge meter or decorative text
+
+QUALITY_NAMES = {
+    QUALITY_HIGH: 'high',
+    QUALITY_MEDIUM: 'medium',
+    QUALITY_LOW: 'low'
+}
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms=1000 / 60, window=30, upgrade_ratio=0.7, cooldown=120):
+        self.level = QUALITY_HIGH
+        self.budget_ms = budget_ms
+        self.upgrade_ratio = upgrade_ratio  # Need this much headroom before restoring effects
+        self.cooldown = cooldown  # Frames to wait after a change before upgrading again
+
+        self.frame_times = deque(maxlen=window)
+        self.frame_count = 0
+        self.last_change_frame = 0
+        self.frame_start = None
+
+        # Recent (frame, old_level, new_level, average_ms) changes for logging
+        self.transitions = deque(maxlen=100)
+        self.on_change = None  # Optional callback(old_level, new_level, average_ms)
+
+    def start_frame(self):
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        self.record((time.perf_counter() - self.frame_start) * 1000)
+        self.frame_start = None
+
+    def record(self, frame_ms):
+        self.frame_count += 1
+        self.frame_times.append(frame_ms)
+
+        # Only decide once we have a full window of samples
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        average = self.average_ms()
+        if average > self.budget_ms and self.level < QUALITY_LOW:
+            self.set_level(self.level + 1, average)
+        elif (average < self.budget_ms * self.upgrade_ratio
+              and self.level > QUALITY_HIGH
+              and self.frame_count - self.last_change_frame >= self.cooldown):
+            self.set_level(self.level - 1, average)
+
+    def average_ms(self):
+        if not self.frame_times:
+            return 0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def set_level(self, level, average_ms=0):
+        old_level = self.level
+        self.level = level
+        self.last_change_frame = self.frame_count
+        # Start a fresh window so the new level is judged on its own frames
+        self.frame_times.clear()
+
+        self.transitions.append((self.frame_count, old_level, level, average_ms))
+        logger.info("Quality %s -> %s (avg %.2f ms)",
+                    QUALITY_NAMES[old_level], QUALITY_NAMES[level], average_ms)
+        if self.on_change:
+            self.on_change(old_level, level, average_ms)
+
+    def level_name(self):
+        return QUALITY_NAMES[self.level]
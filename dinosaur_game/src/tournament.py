@@ -0,0 +1,274 @@
+import argparse
+import math
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+
+# Keep the pygame banner out of every worker's output
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+FPS = 60
+FRAME_BUDGET_MS = 1000 / FPS
+BYTES_PER_PIXEL = 4  # Tiles are RGBX so blits stay on the fast 32-bit path
+TILE_BUFFERS = 3  # Showing, latest finished and being drawn - never the same one
+
+# Keyboard layouts for players sharing the keyboard - the rest use controllers
+KEYBOARD_LAYOUTS = [
+    {pygame.K_SPACE: 'jump', pygame.K_LSHIFT: 'boost', pygame.K_r: 'restart'},
+    {pygame.K_UP: 'jump', pygame.K_RSHIFT: 'boost', pygame.K_RETURN: 'restart'}
+]
+
+# Controller buttons (standard layout: A, B, Start)
+JOYSTICK_BUTTONS = {0: 'jump', 1: 'boost', 7: 'restart'}
+
+# What each action means to the game itself
+ACTION_KEYS = {
+    'jump': pygame.K_SPACE,
+    'boost': pygame.K_LSHIFT,
+    'restart': pygame.K_r
+}
+
+
+def next_back_buffer(front, showing):
+    # The first buffer the host is neither showing nor about to pick up
+    return next(i for i in range(TILE_BUFFERS) if i != front and i != showing)
+
+
+def run_instance(index, seed, tile_size, shm_name, buffers, frame_times, inputs, start_barrier, stop):
+    # Each instance renders offscreen - only the host opens a window
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    from game import DinosaurGame
+
+    # Tuning is pinned at startup - a reload mid-match would reach players at different ticks
+    game = DinosaurGame(seed)
+    game.in_menu = False
+
+    # Tiles in shared memory: draw into the back one, then publish it as front
+    front, showing, lock = buffers
+    shm = shared_memory.SharedMemory(name=shm_name)
+    tile_bytes = tile_size[0] * tile_size[1] * BYTES_PER_PIXEL
+    tiles = [pygame.image.frombuffer(shm.buf[i * tile_bytes:(i + 1) * tile_bytes], tile_size, 'RGBX')
+             for i in range(TILE_BUFFERS)]
+    scaled = pygame.Surface(tile_size, 0, game.screen)
+    with lock:
+        back = next_back_buffer(front.value, showing.value)
+
+    # Everyone starts on the same frame
+    start_barrier.wait()
+    game.game_active = True
+    game.reset_game()
+
+    space_held = False
+    clock = pygame.time.Clock()
+    while not stop.is_set():
+        frame_start = time.perf_counter()
+        game.quality.start_frame()
+
+        # Drain this player's input
+        while True:
+            try:
+                action, is_down = inputs.get_nowait()
+            except queue.Empty:
+                break
+            key = ACTION_KEYS[action]
+            if is_down:
+                game.handle_key_down(key)
+            else:
+                game.handle_key_up(key)
+            if action == 'jump':
+                space_held = is_down
+        game.handle_glide(space_held)
+
+        game.update()
+        game.draw()
+
+        pygame.transform.scale(game.screen, tile_size, scaled)
+        tiles[back].blit(scaled, (0, 0))
+        with lock:
+            front.value = back
+            back = next_back_buffer(front.value, showing.value)
+
+        game.quality.end_frame()
+        frame_times[index] = (time.perf_counter() - frame_start) * 1000
+        clock.tick(FPS)
+
+    # Surfaces hold views into the shared buffer and must go before it closes
+    del tiles
+    shm.close()
+    pygame.quit()
+
+
+class Tournament:
+    def __init__(self, players, width=1600, height=900, seed=None):
+        pygame.init()
+        self.players = players
+        self.cols = math.ceil(math.sqrt(players))
+        self.rows = math.ceil(players / self.cols)
+
+        # Keep the game's 2:1 shape for every tile
+        tile_width = min(width // self.cols, 2 * (height // self.rows))
+        self.tile_size = (tile_width, tile_width // 2)
+        self.screen = pygame.display.set_mode((self.tile_size[0] * self.cols,
+                                               self.tile_size[1] * self.rows))
+        pygame.display.set_caption(f"Dinosaur Game Tournament ({players} players)")
+        self.clock = pygame.time.Clock()
+        self.font = pygame.font.Font(None, 24)
+        self.running = True
+
+        # Spawn gives workers a clean process instead of a copy of our SDL window
+        context = multiprocessing.get_context('spawn')
+        self.stop = context.Event()
+        self.start_barrier = context.Barrier(players + 1)  # Every worker plus the host
+        self.frame_times = context.Array('d', players, lock=False)
+        tile_bytes = self.tile_size[0] * self.tile_size[1] * BYTES_PER_PIXEL
+
+        self.shms = []
+        self.buffers = []
+        self.inputs = []
+        self.tiles = []
+        self.workers = []
+        for index in range(players):
+            shm = shared_memory.SharedMemory(create=True, size=tile_bytes * TILE_BUFFERS)
+            # Latest finished buffer, buffer on screen, and a lock for swapping them
+            buffers = (context.Value('i', 0, lock=False), context.Value('i', 0, lock=False), context.Lock())
+            inputs = context.Queue()
+            # The host reads pixels straight from shared memory, no copies between processes
+            self.tiles.append([pygame.image.frombuffer(shm.buf[i * tile_bytes:(i + 1) * tile_bytes],
+                                                       self.tile_size, 'RGBX') for i in range(TILE_BUFFERS)])
+            worker = context.Process(
+                target=run_instance,
+                args=(index, seed, self.tile_size, shm.name, buffers, self.frame_times, inputs,
+                      self.start_barrier, self.stop),
+                daemon=True
+            )
+            self.shms.append(shm)
+            self.buffers.append(buffers)
+            self.inputs.append(inputs)
+            self.workers.append(worker)
+
+        # Players after the keyboard layouts get controllers as they are plugged in.
+        # SDL also reports controllers that are already connected this way
+        pygame.joystick.init()
+        self.joysticks = {}  # instance_id -> Joystick
+        self.controller_players = {}  # instance_id -> player index
+
+    def send(self, player, action, is_down):
+        if player < self.players:
+            self.inputs[player].put((action, is_down))
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+
+            elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                if event.key == pygame.K_ESCAPE:
+                    self.running = False
+                    continue
+                for player, layout in enumerate(KEYBOARD_LAYOUTS):
+                    if event.key in layout:
+                        self.send(player, layout[event.key], event.type == pygame.KEYDOWN)
+
+            elif event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+                player = self.controller_players.get(event.instance_id)
+                if player is not None and event.button in JOYSTICK_BUTTONS:
+                    self.send(player, JOYSTICK_BUTTONS[event.button],
+                              event.type == pygame.JOYBUTTONDOWN)
+
+            elif event.type == pygame.JOYDEVICEADDED:
+                self.add_controller(event.device_index)
+
+            elif event.type == pygame.JOYDEVICEREMOVED:
+                self.remove_controller(event.instance_id)
+
+    def add_controller(self, device_index):
+        joystick = pygame.joystick.Joystick(device_index)
+        instance_id = joystick.get_instance_id()
+        if instance_id in self.controller_players:
+            return
+
+        # Take the first free controller seat, so a reconnect gets its old player back
+        taken = set(self.controller_players.values())
+        for player in range(len(KEYBOARD_LAYOUTS), self.players):
+            if player not in taken:
+                self.joysticks[instance_id] = joystick
+                self.controller_players[instance_id] = player
+                return
+
+    def remove_controller(self, instance_id):
+        player = self.controller_players.pop(instance_id, None)
+        self.joysticks.pop(instance_id, None)
+        if player is not None:
+            # Don't leave the player gliding on a button nobody can release
+            self.send(player, 'jump', False)
+
+    def draw(self):
+        for index in range(self.players):
+            x = (index % self.cols) * self.tile_size[0]
+            y = (index // self.cols) * self.tile_size[1]
+            # Claim the latest finished buffer so the worker won't draw into it
+            front, showing, lock = self.buffers[index]
+            with lock:
+                showing.value = front.value
+            self.screen.blit(self.tiles[index][showing.value], (x, y))
+
+            # Per-instance frame time so stragglers stand out
+            frame_ms = self.frame_times[index]
+            color = (255, 0, 0) if frame_ms > FRAME_BUDGET_MS else (0, 128, 0)
+            stats_text = self.font.render(f'P{index + 1}  {frame_ms:.1f} ms', True, color)
+            self.screen.blit(stats_text, stats_text.get_rect(topright=(x + self.tile_size[0] - 5, y + 5)))
+
+            # Tile border
+            pygame.draw.rect(self.screen, (100, 100, 100), (x, y, *self.tile_size), 1)
+
+    def run(self):
+        for worker in self.workers:
+            worker.start()
+
+        try:
+            # A worker that fails to start breaks the barrier instead of hanging us
+            self.start_barrier.wait(timeout=60)
+            while self.running:
+                self.handle_events()
+                self.draw()
+                pygame.display.flip()
+                self.clock.tick(FPS)
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self.stop.set()
+        for worker in self.workers:
+            worker.join(timeout=2)
+            if worker.is_alive():
+                worker.kill()
+
+        # Release our views into the buffers before freeing them
+        self.tiles = []
+        for shm in self.shms:
+            shm.close()
+            shm.unlink()
+        pygame.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run several games side by side for a local tournament")
+    parser.add_argument('--players', type=int, default=4, help="number of games (1-16)")
+    parser.add_argument('--width', type=int, default=1600, help="window width")
+    parser.add_argument('--height', type=int, default=900, help="window height")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="give every game the same course")
+    args = parser.parse_args()
+    if not 1 <= args.players <= 16:
+        parser.error("--players must be between 1 and 16")
+
+    Tournament(args.players, args.width, args.height, args.seed).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CONFIG_VERSION = 1
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tuning.json')
+
+PLAYER_KEYS = [
+    'gravity', 'min_jump_power', 'max_jump_power', 'charge_rate',
+    'glide_gravity', 'min_glide_speed',
+    'fart_boost_power', 'fart_forward', 'fart_duration',
+    'poop_boost_power', 'poop_forward', 'poop_duration'
+]
+
+# Background builds pause between slices of a table so the game thread
+# never waits long for the GIL
+SLICE_SIZE = 500
+
+
+def load_config(path=DEFAULT_PATH):
+    with open(path) as config_file:
+        config = json.load(config_file)
+    if not isinstance(config, dict):
+        raise ValueError(f"{path}: expected a JSON object at the top level")
+    if config.get('version') != CONFIG_VERSION:
+        raise ValueError(f"{path}: expected tuning version {CONFIG_VERSION}, got {config.get('version')}")
+    return config
+
+
+def setting(config, path):
+    # Look up a dotted path like 'obstacles.spawn_time.min'
+    value = config
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            raise ValueError(f"missing tuning setting '{path}'")
+        value = value[key]
+    return value
+
+
+def number(config, path, lo=None, hi=None, integer=False):
+    value = setting(config, path)
+    kinds = int if integer else (int, float)
+    if isinstance(value, bool) or not isinstance(value, kinds):
+        raise ValueError(f"tuning setting '{path}' must be {'an integer' if integer else 'a number'}")
+    if lo is not None and value < lo:
+        raise ValueError(f"tuning setting '{path}' must be at least {lo}, got {value}")
+    if hi is not None and value > hi:
+        raise ValueError(f"tuning setting '{path}' must be at most {hi}, got {value}")
+    return value
+
+
+def chance(config, path):
+    return number(config, path, 0, 1)
+
+
+def int_range(config, path, lo=None):
+    value = setting(config, path)
+    if (not isinstance(value, list) or len(value) != 2
+            or any(isinstance(item, bool) or not isinstance(item, int) for item in value)
+            or value[0] > value[1]):
+        raise ValueError(f"tuning setting '{path}' must be two integers [low, high] with low <= high")
+    if lo is not None and value[0] < lo:
+        raise ValueError(f"tuning setting '{path}' must not go below {lo}")
+    return tuple(value)
+
+
+def step_table(size, step, value_for_step):
+    # For ramps that only change every `step` points - one value per step, repeated
+    table = []
+    for index in range(0, size, step):
+        table.extend([value_for_step(index // step)] * step)
+    del table[size:]
+    return table
+
+
+def linear_table(size, value_at, lo, hi, pause=0):
+    # For ramps that are linear in score - once one is clamped it stays clamped,
+    # so the rest of the table is filled in one go
+    if size < 2 or value_at(1) == value_at(0):
+        return [min(hi, max(lo, value_at(0)))] * size
+    limit = hi if value_at(1) > value_at(0) else lo
+    table = []
+    for score in range(size):
+        value = min(hi, max(lo, value_at(score)))
+        table.append(value)
+        if value == limit:
+            table.extend([limit] * (size - score - 1))
+            break
+        if score % SLICE_SIZE == SLICE_SIZE - 1:
+            time.sleep(pause)
+    return table
+
+
+class TuningTables:
+    # Difficulty compiled into per-score lookup tables, so the game does a list
+    # index each frame instead of recomputing and clamping the ramps.
+    # Everything is checked here so a bad file never reaches the game
+    def __init__(self, config, pause=0):
+        self.max_score = number(config, 'max_score', lo=0, integer=True)
+        size = self.max_score + 1
+
+        speed_base = number(config, 'speed.base', lo=1)
+        speed_step = number(config, 'speed.points_per_step', lo=1, integer=True)
+        self.game_speeds = step_table(size, speed_step, lambda step: speed_base + step)
+
+        spawn_base = chance(config, 'obstacles.spawn_chance.base')
+        spawn_falloff = number(config, 'obstacles.spawn_chance.falloff', lo=1)
+        spawn_min = chance(config, 'obstacles.spawn_chance.min')
+        spawn_max = number(config, 'obstacles.spawn_chance.max', lo=spawn_min, hi=1)
+        self.spawn_chances = linear_table(size, lambda score: spawn_base - score / spawn_falloff,
+                                          spawn_min, spawn_max, pause)
+
+        group_base = chance(config, 'obstacles.group_chance.base')
+        group_falloff = number(config, 'obstacles.group_chance.falloff', lo=1)
+        group_min = chance(config, 'obstacles.group_chance.min')
+        self.group_chances = linear_table(size, lambda score: group_base - score / group_falloff,
+                                          group_min, 1, pause)
+        self.group_size = int_range(config, 'obstacles.group_size', lo=1)
+        self.group_spacing = int_range(config, 'obstacles.group_spacing', lo=0)
+
+        # Spawn gaps shrink with score, and the gap after a spawn shrinks twice as fast
+        time_base = number(config, 'obstacles.spawn_time.base', integer=True)
+        time_step = number(config, 'obstacles.spawn_time.points_per_frame', lo=1, integer=True)
+        time_min = number(config, 'obstacles.spawn_time.min', lo=0, integer=True)
+        time_max = number(config, 'obstacles.spawn_time.max', lo=time_min, integer=True)
+        self.spawn_times = step_table(size, time_step,
+                                      lambda step: min(time_max, max(time_min, max(time_min, time_base - step) - step)))
+
+        star_base = chance(config, 'powerups.spawn_chance.base')
+        star_falloff = number(config, 'powerups.spawn_chance.falloff', lo=1)
+        star_min = chance(config, 'powerups.spawn_chance.min')
+        self.powerup_chances = linear_table(size, lambda score: star_base * (1 - score / star_falloff),
+                                            star_min, 1, pause)
+        self.powerup_y_range = int_range(config, 'powerups.y_range')
+        self.powerup_duration = number(config, 'powerups.duration', lo=1, integer=True)
+
+        # Player physics as plain attributes (gravity, min_jump_power, ...)
+        for key in PLAYER_KEYS:
+            setattr(self, key, number(config, f'player.{key}'))
+
+        sizes = setting(config, 'cactus.sizes')
+        if not isinstance(sizes, dict) or not sizes:
+            raise ValueError("tuning setting 'cactus.sizes' must list at least one size")
+        self.cactus_types = list(sizes)
+        self.cactus_sizes = {name: (int_range(config, f'cactus.sizes.{name}.width_range', lo=1),
+                                    int_range(config, f'cactus.sizes.{name}.height_range', lo=1))
+                             for name in sizes}
+        self.cactus_wide_chance = chance(config, 'cactus.wide_chance')
+        self.cactus_wide_scale = (number(config, 'cactus.wide_width_scale', lo=0.1),
+                                  number(config, 'cactus.wide_height_scale', lo=0.1))
+
+    def index(self, score):
+        # Difficulty stops ramping once the score runs past the tables
+        return score if score < self.max_score else self.max_score
+
+
+def load_tables(path=DEFAULT_PATH, pause=0):
+    return TuningTables(load_config(path), pause)
+
+
+class TuningWatcher:
+    # Polls the config file in a background thread and compiles changes there,
+    # so the game only has to pick up the finished tables between ticks
+    def __init__(self, path=DEFAULT_PATH, interval=0.5, pause=0.001):
+        self.path = path
+        self.interval = interval
+        self.pause = pause
+        self.pending = None
+        self.lock = threading.Lock()
+        self.last_mtime = self.get_mtime()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+
+    def get_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def watch(self):
+        while not self.stop_event.wait(self.interval):
+            mtime = self.get_mtime()
+            if mtime is None or mtime == self.last_mtime:
+                continue
+            self.last_mtime = mtime
+            try:
+                tables = load_tables(self.path, self.pause)
+            except Exception as error:
+                # Keep playing on the old tables until the file is fixed
+                logger.warning("Ignoring bad tuning file %s: %s", self.path, error)
+                continue
+            with self.lock:
+                self.pending = tables
+            logger.info("Reloaded tuning from %s", self.path)
+
+    def poll(self):
+        # Hand over newly compiled tables once - a single reference swap
+        with self.lock:
+            tables, self.pending = self.pending, None
+        return tables